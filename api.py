@@ -9,7 +9,7 @@ import time
 import datetime
 from typing import List, Dict, Any, Optional, Union
 from utils.logger import logger, debug_log
-from config import API_KEY, API_URL, API_TIMEOUT, MONITORED_ONLY, SKIP_FUTURE_RELEASES, COMMAND_WAIT_DELAY, COMMAND_WAIT_ATTEMPTS
+from config import API_KEY, API_URL, API_TIMEOUT, MONITORED_ONLY, SKIP_FUTURE_RELEASES, COMMAND_WAIT_DELAY, COMMAND_WAIT_ATTEMPTS, QUEUE_PAGE_SIZE
 
 # Create a session for reuse
 session = requests.Session()
@@ -65,18 +65,79 @@ def wait_for_command(command_id: int):
 
     return response['status'].lower() in ['complete', 'completed']
 
-def get_download_queue_size() -> Optional[int]:
+def get_download_queue() -> Optional[Dict[str, Any]]:
     """
-    GET /api/v3/queue
-    Returns total number of items in the queue with the status 'downloading'.
+    GET /api/v3/queue (paged)
+    Reads the full download queue page by page. Items still held by a download
+    client (downloading, queued, paused, delayed) count as in use. Stalled, warning
+    and finished items (completed, importing or failed) are counted separately and
+    do not count as in use. In use, stalled and warning counts are also broken down
+    by download client and protocol.
+    Returns None if the queue could not be read.
     """
-    response = radarr_request("queue?status=downloading")
-    total_records = response.get("totalRecords", 0)
-    if not isinstance(total_records, int):
-        total_records = 0
-    logger.debug(f"Download Queue Size: {total_records}")
+    summary = {
+        "total": 0,
+        "in_use": 0,
+        "stalled": 0,
+        "warning": 0,
+        "finished": 0,
+        "clients": {},
+        "protocols": {},
+    }
 
-    return total_records
+    page = 1
+    while True:
+        response = radarr_request(f"queue?page={page}&pageSize={QUEUE_PAGE_SIZE}")
+        if not isinstance(response, dict):
+            logger.warning(f"Unable to read download queue page {page}.")
+            return None
+
+        records = response.get("records") or []
+        for record in records:
+            category = classify_queue_item(record)
+            summary["total"] += 1
+            summary[category] += 1
+
+            if category != "finished":
+                client = record.get("downloadClient") or "Unknown"
+                protocol = str(record.get("protocol") or "unknown").lower()
+                for counts in (summary["clients"].setdefault(client, {"in_use": 0, "stalled": 0, "warning": 0}),
+                               summary["protocols"].setdefault(protocol, {"in_use": 0, "stalled": 0, "warning": 0})):
+                    counts[category] += 1
+
+        total_records = response.get("totalRecords", 0)
+        if not isinstance(total_records, int):
+            total_records = 0
+        if not records or page * QUEUE_PAGE_SIZE >= total_records:
+            break
+        page += 1
+
+    debug_log("Download queue breakdown:", summary)
+    return summary
+
+def classify_queue_item(record: Dict) -> str:
+    """
+    Classify a queue record as 'stalled', 'warning', 'finished' or 'in_use'.
+    Radarr has no dedicated stalled status, so an item counts as stalled when its
+    errorMessage or any of its statusMessages mention "stalled"; any other item
+    with a warning status counts as a warning.
+    """
+    status = str(record.get("status") or "").lower()
+    tracked_status = str(record.get("trackedDownloadStatus") or "").lower()
+    tracked_state = str(record.get("trackedDownloadState") or "").lower()
+
+    messages = [record.get("errorMessage") or ""]
+    for status_message in record.get("statusMessages") or []:
+        messages.append(status_message.get("title") or "")
+        messages.extend(status_message.get("messages") or [])
+
+    if any("stalled" in str(message).lower() for message in messages):
+        return "stalled"
+    if status == "warning" or tracked_status == "warning":
+        return "warning"
+    if status in ["completed", "failed"] or tracked_state in ["importpending", "importing", "imported", "failedpending", "failed"]:
+        return "finished"
+    return "in_use"
 
 def get_movies() -> List[Dict]:
     """Get all movies from Radarr (full list)"""
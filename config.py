@@ -67,6 +67,15 @@ except ValueError:
     MINIMUM_DOWNLOAD_QUEUE_SIZE = -1
     print(f"Warning: Invalid MINIMUM_DOWNLOAD_QUEUE_SIZE value, using default: {MINIMUM_DOWNLOAD_QUEUE_SIZE}")
 
+# Number of queue records to fetch per page when reading the download queue (default 100)
+try:
+    QUEUE_PAGE_SIZE = int(os.environ.get("QUEUE_PAGE_SIZE", "100"))
+    if QUEUE_PAGE_SIZE <= 0:
+        raise ValueError
+except ValueError:
+    QUEUE_PAGE_SIZE = 100
+    print(f"Warning: Invalid QUEUE_PAGE_SIZE value, using default: {QUEUE_PAGE_SIZE}")
+
 # Selection Settings
 RANDOM_SELECTION = os.environ.get("RANDOM_SELECTION", "true").lower() == "true"
 MONITORED_ONLY = os.environ.get("MONITORED_ONLY", "true").lower() == "true"
@@ -86,7 +95,7 @@ def log_configuration(logger):
     logger.info(f"Missing Content Configuration: HUNT_MISSING_MOVIES={HUNT_MISSING_MOVIES}")
     logger.info(f"Upgrade Configuration: HUNT_UPGRADE_MOVIES={HUNT_UPGRADE_MOVIES}")
     logger.info(f"State Reset Interval: {STATE_RESET_INTERVAL_HOURS} hours")
-    logger.info(f"Minimum Download Queue Size: {MINIMUM_DOWNLOAD_QUEUE_SIZE}")
+    logger.info(f"Minimum Download Queue Size: {MINIMUM_DOWNLOAD_QUEUE_SIZE}, Queue Page Size: {QUEUE_PAGE_SIZE}")
     logger.info(f"MONITORED_ONLY={MONITORED_ONLY}, RANDOM_SELECTION={RANDOM_SELECTION}")
     logger.info(f"SKIP_FUTURE_RELEASES={SKIP_FUTURE_RELEASES}")
     logger.info(f"HUNT_MODE={HUNT_MODE}, SLEEP_DURATION={SLEEP_DURATION}s")
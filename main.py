@@ -6,15 +6,76 @@ Main entry point for the application
 
 import time
 import sys
+from typing import Dict, Any, Optional, Tuple
 from utils.logger import logger
-from config import HUNT_MODE, SLEEP_DURATION, MINIMUM_DOWNLOAD_QUEUE_SIZE, log_configuration
+from config import HUNT_MODE, HUNT_MISSING_MOVIES, HUNT_UPGRADE_MOVIES, SLEEP_DURATION, MINIMUM_DOWNLOAD_QUEUE_SIZE, log_configuration
 from missing import process_missing_movies
 from upgrade import process_cutoff_upgrades
 from state import check_state_reset, calculate_reset_time
-from api import get_download_queue_size
+from api import get_download_queue
+
+def log_download_queue(queue: Dict[str, Any]) -> None:
+    """Log the download queue breakdown by download client and protocol"""
+    logger.info(f"Download queue: {queue['total']} item(s), {queue['in_use']} in use, "
+                f"{queue['stalled']} stalled, {queue['warning']} warning, {queue['finished']} finished")
+    for name, counts in sorted(queue["clients"].items()):
+        logger.info(f" - Client {name}: {counts['in_use']} in use, "
+                    f"{counts['stalled']} stalled, {counts['warning']} warning")
+    for name, counts in sorted(queue["protocols"].items()):
+        logger.debug(f" - Protocol {name}: {counts['in_use']} in use, "
+                     f"{counts['stalled']} stalled, {counts['warning']} warning")
+
+def calculate_search_limits(queue: Optional[Dict[str, Any]], favour_upgrades: bool = False) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Work out how many missing and upgrade searches the download queue can absorb this cycle.
+    Items still held by a download client count against MINIMUM_DOWNLOAD_QUEUE_SIZE and a hunt
+    runs while that count is at or below the threshold. If the threshold is smaller than
+    HUNT_MISSING_MOVIES + HUNT_UPGRADE_MOVIES the full configured batch is searched, as before.
+    Otherwise the batch is trimmed to the room left below the threshold (at least one search)
+    and split between missing and upgrade searches in proportion to their configured values.
+    The remainder of the split goes to upgrades when favour_upgrades is set and to missing
+    searches otherwise, so alternating it between cycles gives both hunts a turn.
+    
+    Returns:
+        (missing_limit, upgrade_limit), where None means no limit beyond the configured value
+    """
+    if MINIMUM_DOWNLOAD_QUEUE_SIZE < 0:
+        return None, None
+
+    missing_wanted = max(HUNT_MISSING_MOVIES, 0) if HUNT_MODE in ["missing", "both"] else 0
+    upgrade_wanted = max(HUNT_UPGRADE_MOVIES, 0) if HUNT_MODE in ["upgrade", "both"] else 0
+    wanted = missing_wanted + upgrade_wanted
+    if wanted == 0:
+        return None, None
+
+    if queue is None:
+        logger.warning("Unable to read the download queue. Skipped processing.")
+        return 0, 0
+
+    if queue["in_use"] > MINIMUM_DOWNLOAD_QUEUE_SIZE:
+        logger.info(f"Download queue size ({queue['in_use']}) is above the minimum threshold ({MINIMUM_DOWNLOAD_QUEUE_SIZE}).  Skipped processing.")
+        return 0, 0
+
+    capacity = max(MINIMUM_DOWNLOAD_QUEUE_SIZE - queue["in_use"], 1)
+    if MINIMUM_DOWNLOAD_QUEUE_SIZE < wanted or capacity >= wanted:
+        return missing_wanted, upgrade_wanted
+
+    if favour_upgrades:
+        missing_limit = capacity * missing_wanted // wanted
+        upgrade_limit = capacity - missing_limit
+    else:
+        upgrade_limit = capacity * upgrade_wanted // wanted
+        missing_limit = capacity - upgrade_limit
+    logger.info(f"Download queue has room for {capacity} of {wanted} search(es) "
+                f"(threshold {MINIMUM_DOWNLOAD_QUEUE_SIZE}). "
+                f"Limiting this cycle to {missing_limit} missing and {upgrade_limit} upgrade search(es).")
+    return missing_limit, upgrade_limit
 
 def main_loop() -> None:
     """Main processing loop for Huntarr-Radarr"""
+    # Alternates which hunt gets the remainder when the download queue limits the batch
+    favour_upgrades = False
+
     while True:
         # Check if state files need to be reset
         check_state_reset()
@@ -24,21 +85,29 @@ def main_loop() -> None:
         # Track if any processing was done in this cycle
         processing_done = False
         
-        # Check if we should ignore the download queue size or if we are below the minimum queue size
-        download_queue_size = get_download_queue_size()
-        if MINIMUM_DOWNLOAD_QUEUE_SIZE < 0 or (MINIMUM_DOWNLOAD_QUEUE_SIZE >= 0 and download_queue_size <= MINIMUM_DOWNLOAD_QUEUE_SIZE):
-        
+        # Work out how many searches the download queue can absorb, unless the queue size is ignored
+        queue = None
+        if MINIMUM_DOWNLOAD_QUEUE_SIZE >= 0:
+            queue = get_download_queue()
+            if queue is not None:
+                log_download_queue(queue)
+        missing_limit, upgrade_limit = calculate_search_limits(queue, favour_upgrades)
+        favour_upgrades = not favour_upgrades
+
+        if missing_limit != 0 or upgrade_limit != 0:
             # Process movies based on HUNT_MODE
             if HUNT_MODE in ["missing", "both"]:
-                if process_missing_movies():
+                missing_searched = process_missing_movies(missing_limit)
+                if missing_searched:
                     processing_done = True
+
+                # Hand any room the missing hunt did not use on to upgrades
+                if missing_limit is not None and upgrade_limit is not None:
+                    upgrade_limit = min(upgrade_limit + missing_limit - missing_searched, max(HUNT_UPGRADE_MOVIES, 0))
                     
             if HUNT_MODE in ["upgrade", "both"]:
-                if process_cutoff_upgrades():
+                if process_cutoff_upgrades(upgrade_limit):
                     processing_done = True
-            
-        else:
-            logger.info(f"Download queue size ({download_queue_size}) is above the minimum threshold ({MINIMUM_DOWNLOAD_QUEUE_SIZE}).  Skipped processing.")
 
         # Calculate time until the next reset
         calculate_reset_time()
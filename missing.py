@@ -6,35 +6,44 @@ Handles searching for missing movies in Radarr
 
 import random
 import time
-from typing import List
+from typing import List, Optional
 from utils.logger import logger
 from config import HUNT_MISSING_MOVIES, MONITORED_ONLY, RANDOM_SELECTION
 from api import get_missing_movies, refresh_movie, movie_search, rescan_movie
 from state import load_processed_ids, save_processed_id, truncate_processed_list, PROCESSED_MISSING_FILE
 
-def process_missing_movies() -> bool:
+def process_missing_movies(max_movies: Optional[int] = None) -> int:
     """
     Process movies that are missing files.
     
+    Args:
+        max_movies: Maximum number of movies to search this cycle.
+                    Defaults to HUNT_MISSING_MOVIES.
+    
     Returns:
-        True if any processing was done, False otherwise
+        Number of movies searched this cycle
     """
     logger.info("=== Checking for Missing Movies ===")
 
     # Skip if HUNT_MISSING_MOVIES is set to 0
     if HUNT_MISSING_MOVIES <= 0:
         logger.info("HUNT_MISSING_MOVIES is set to 0, skipping missing content")
-        return False
+        return 0
+
+    if max_movies is None:
+        max_movies = HUNT_MISSING_MOVIES
+    if max_movies <= 0:
+        logger.info("No searches allotted this cycle, skipping missing content")
+        return 0
 
     missing_movies = get_missing_movies()
     if not missing_movies:
         logger.info("No missing movies found.")
-        return False
+        return 0
     
     logger.info(f"Found {len(missing_movies)} movie(s) with missing files.")
     processed_missing_ids = load_processed_ids(PROCESSED_MISSING_FILE)
     movies_processed = 0
-    processing_done = False
     
     # Randomize or use sequential indices
     indices = list(range(len(missing_movies)))
@@ -42,7 +51,7 @@ def process_missing_movies() -> bool:
         random.shuffle(indices)
     
     for i in indices:
-        if movies_processed >= HUNT_MISSING_MOVIES:
+        if movies_processed >= max_movies:
             break
         
         movie = missing_movies[i]
@@ -67,7 +76,6 @@ def process_missing_movies() -> bool:
         search_res = movie_search(movie_id)
         if search_res:
             logger.info(f"Search command completed successfully.")
-            processing_done = True
         else:
             logger.warning("WARNING: Movie search failed.")
             continue
@@ -83,9 +91,9 @@ def process_missing_movies() -> bool:
         # Mark processed
         save_processed_id(PROCESSED_MISSING_FILE, movie_id)
         movies_processed += 1
-        logger.info(f"Processed {movies_processed}/{HUNT_MISSING_MOVIES} missing movies this cycle.")
+        logger.info(f"Processed {movies_processed}/{max_movies} missing movies this cycle.")
     
     # Truncate processed list if needed
     truncate_processed_list(PROCESSED_MISSING_FILE)
     
-    return processing_done
\ No newline at end of file
+    return movies_processed
\ No newline at end of file
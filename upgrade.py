@@ -6,35 +6,45 @@ Handles searching for movies that need quality upgrades in Radarr
 
 import random
 import time
+from typing import Optional
 from utils.logger import logger
 from config import HUNT_UPGRADE_MOVIES, RANDOM_SELECTION
 from api import get_cutoff_unmet, refresh_movie, movie_search, rescan_movie
 from state import load_processed_ids, save_processed_id, truncate_processed_list, PROCESSED_UPGRADE_FILE
 
-def process_cutoff_upgrades() -> bool:
+def process_cutoff_upgrades(max_movies: Optional[int] = None) -> int:
     """
     Process movies that need quality upgrades.
     
+    Args:
+        max_movies: Maximum number of movies to search this cycle.
+                    Defaults to HUNT_UPGRADE_MOVIES.
+    
     Returns:
-        True if any processing was done, False otherwise
+        Number of movies searched this cycle
     """
     logger.info("=== Checking for Quality Upgrades (Cutoff Unmet) ===")
     
     # Skip if HUNT_UPGRADE_MOVIES is set to 0
     if HUNT_UPGRADE_MOVIES <= 0:
         logger.info("HUNT_UPGRADE_MOVIES is set to 0, skipping quality upgrades")
-        return False
+        return 0
+
+    if max_movies is None:
+        max_movies = HUNT_UPGRADE_MOVIES
+    if max_movies <= 0:
+        logger.info("No searches allotted this cycle, skipping quality upgrades")
+        return 0
     
     upgrade_movies = get_cutoff_unmet()
     
     if not upgrade_movies:
         logger.info("No movies found that need quality upgrades.")
-        return False
+        return 0
     
     logger.info(f"Found {len(upgrade_movies)} movies that need quality upgrades.")
     processed_upgrade_ids = load_processed_ids(PROCESSED_UPGRADE_FILE)
     movies_processed = 0
-    processing_done = False
     
     # Randomize or use sequential indices
     indices = list(range(len(upgrade_movies)))
@@ -42,7 +52,7 @@ def process_cutoff_upgrades() -> bool:
         random.shuffle(indices)
     
     for i in indices:
-        if movies_processed >= HUNT_UPGRADE_MOVIES:
+        if movies_processed >= max_movies:
             break
         
         movie = upgrade_movies[i]
@@ -68,7 +78,6 @@ def process_cutoff_upgrades() -> bool:
         search_res = movie_search(movie_id)
         if search_res:
             logger.info(f"Search command completed successfully.")
-            processing_done = True
             
             # Rescan
             logger.info(" - Rescanning movie folder...")
@@ -81,11 +90,11 @@ def process_cutoff_upgrades() -> bool:
             # Mark processed
             save_processed_id(PROCESSED_UPGRADE_FILE, movie_id)
             movies_processed += 1
-            logger.info(f"Processed {movies_processed}/{HUNT_UPGRADE_MOVIES} upgrade movies this cycle.")
+            logger.info(f"Processed {movies_processed}/{max_movies} upgrade movies this cycle.")
         else:
             logger.warning(f"WARNING: Search command failed for movie ID {movie_id}.")
     
     logger.info(f"Completed processing {movies_processed} upgrade movies for this cycle.")
     truncate_processed_list(PROCESSED_UPGRADE_FILE)
     
-    return processing_done
\ No newline at end of file
+    return movies_processed
\ No newline at end of file